@@ -1,46 +1,82 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple, Optional
 
 import pandas as pd
-from dateutil import parser
 
+try:  # pyarrow ships with streamlit; fall back to python-backed strings without it
+    import pyarrow  # noqa: F401
+
+    _ARROW_STRING = "string[pyarrow]"
+except Exception:
+    _ARROW_STRING = "string"
+
+# Rows sampled by _to_utc to decide whether the ISO8601 fast path is worth trying.
+_ISO_PROBE_ROWS = 64
 
 # -------------------------------
 # Helpers
 # -------------------------------
 def _clean_cols(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
+    # shallow copy: renaming columns never needs to copy the column data
+    out = df.copy(deep=False)
     out.columns = [str(c).strip() for c in out.columns]
     return out
 
 
 def _lower_cols(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
+    out = df.copy(deep=False)
     out.columns = [str(c).strip().lower() for c in out.columns]
     return out
 
 
+def _col(df: pd.DataFrame, name: str) -> pd.Series:
+    """Column `name`, or an all-NA stand-in when missing (df itself is never modified)."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(pd.NA, index=df.index, dtype="object")
+
+
 def _to_utc(series: pd.Series) -> pd.Series:
-    """Parse mixed datetime strings -> timezone-aware UTC timestamps."""
-    def parse_one(x):
-        if pd.isna(x) or str(x).strip() == "":
-            return pd.NaT
-        try:
-            dt = parser.parse(str(x))
-            if dt.tzinfo is None:
-                # assume already UTC if no tz given
-                return pd.Timestamp(dt).tz_localize("UTC")
-            return pd.Timestamp(dt).tz_convert("UTC")
-        except Exception:
-            return pd.NaT
-
-    return series.apply(parse_one)
+    """Parse mixed datetime strings -> timezone-aware UTC timestamps.
+
+    ISO8601 values are parsed in one vectorized pass; whatever is left
+    (e.g. "Jan 5 2024 10:00") is retried with pandas' per-value parser.
+    Values without a timezone are assumed to already be UTC.
+
+    Numbers are parsed as text, never as epoch offsets:
+
+    >>> bool(_to_utc(pd.Series([1.7e9, float("nan")])).isna().all())
+    True
+    >>> _to_utc(pd.Series(["2024-01-05T10:00:00Z", "Jan 5 2024 10:00", None])).tolist()[1]
+    Timestamp('2024-01-05 10:00:00+0000', tz='UTC')
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        # already parsed upstream: only localize / convert
+        return pd.to_datetime(series, utc=True)
+
+    # Parse everything else as text, like the per-value parser did: a numeric
+    # column (e.g. 20240105 read from CSV) must never be read as epoch offsets.
+    series = series.astype("string")
+
+    # Probe a small sample first: if it's mostly not ISO8601, a full ISO pass is wasted work.
+    sample = series.dropna().head(_ISO_PROBE_ROWS).str.strip()
+    sample = sample[sample != ""]
+    if len(sample) and pd.to_datetime(sample, errors="coerce", utc=True, format="ISO8601").notna().mean() < 0.9:
+        return pd.to_datetime(series, errors="coerce", utc=True, format="mixed")
+
+    out = pd.to_datetime(series, errors="coerce", utc=True, format="ISO8601")
+    leftover = out.isna() & series.notna() & (series.str.strip() != "")
+    if leftover.any():
+        # The two passes may infer different resolutions (e.g. [s] vs [ns]);
+        # mask() upcasts to the finer one instead of failing the write-back.
+        fallback = pd.to_datetime(series[leftover], errors="coerce", utc=True, format="mixed")
+        out = out.mask(leftover, fallback)
+    return out
 
 
 def _to_int(series: pd.Series, default: int = 0) -> pd.Series:
-    return pd.to_numeric(series, errors="coerce").fillna(default).astype(int)
+    return pd.to_numeric(series, errors="coerce").fillna(default).astype("int64")
 
 
 def _to_float(series: pd.Series) -> pd.Series:
@@ -48,23 +84,55 @@ def _to_float(series: pd.Series) -> pd.Series:
 
 
 def _safe_str(series: pd.Series) -> pd.Series:
-    return series.astype("string").fillna("").astype("string")
+    # Arrow-backed when available, so the .str.* calls downstream run on Arrow's compute kernels
+    return series.astype(_ARROW_STRING).fillna("")
+
+
+def _norm_enum(
+    series: pd.Series,
+    *,
+    strip: bool = True,
+    upper: bool = True,
+    width: Optional[int] = None,
+) -> pd.Series:
+    """
+    Clean a low-cardinality text column (country, currency, carrier) into a category.
+
+    The string cleanup runs once per distinct value instead of once per row;
+    rows are then remapped through the factorized codes. Missing values
+    become "" (same as `_safe_str`).
+    """
+    codes, uniques = pd.factorize(series)
+
+    labels = []
+    for v in uniques:
+        v = str(v)
+        if strip:
+            v = v.strip()
+        if upper:
+            v = v.upper()
+        labels.append(v[:width] if width else v)
+    labels.append("")  # slot for missing values
+    codes[codes < 0] = len(uniques)
+
+    # Distinct raw values can clean to the same label (" us" / "US"): merge them.
+    label_codes, categories = pd.factorize(pd.Index(labels, dtype=_ARROW_STRING))
+    return pd.Series(
+        pd.Categorical.from_codes(label_codes[codes], categories=categories),
+        index=series.index,
+        name=series.name,
+    )
 
 
 def _validation(errors: List[str]) -> Dict[str, Any]:
     return {"validation_errors": errors}
 
 
-@dataclass(frozen=True)
-class ColumnRule:
-    name: str
-    required: bool = True
-
+def _require_cols(df: pd.DataFrame, required: Tuple[str, ...], table: str) -> List[str]:
+    """Errors for `required` columns missing from the (renamed) input frame.
 
-def _require_cols(df: pd.DataFrame, rules: List[ColumnRule], table: str) -> List[str]:
-    errs: List[str] = []
-    cols = set(df.columns)
-    for r in rules:
-        if r.required and r.name not in cols:
-            errs.append(f"[{table}] Missing required column: {r.name}")
-    return errs
+    Run this before cleaning: the normalizers read missing columns as all-NA
+    via `_col`, so the cleaned frame always has every column.
+    """
+    missing = set(required).difference(df.columns)
+    return [f"[{table}] Missing required column: {name}" for name in required if name in missing]
@@ -1,31 +1,35 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Set, Tuple
 
 import pandas as pd
 
-from .helpers import ColumnRule, _clean_cols, _lower_cols, _require_cols, _safe_str, _to_float, _to_int, _to_utc, _validation
+from .helpers import _clean_cols, _col, _lower_cols, _norm_enum, _require_cols, _safe_str, _to_float, _to_int, _to_utc, _validation
 
 # -------------------------------
 # Shopify detection + mapping
 # -------------------------------
+_SHOPIFY_SIGNALS = frozenset({
+    "name",
+    "created at",
+    "lineitem sku",
+    "lineitem quantity",
+    "variant sku",
+    "shipping country",
+    "shipping province",
+    "financial status",
+    "fulfillment status",
+})
+
+
+def _detect_shopify_cols(cols: Set[str]) -> bool:
+    """Shopify check on already cleaned (stripped + lower-cased) column names."""
+    return len(_SHOPIFY_SIGNALS & cols) >= 3
+
+
 def detect_shopify_orders(raw_df: pd.DataFrame) -> bool:
-    df = _lower_cols(_clean_cols(raw_df))
-    cols = set(df.columns)
-
-    shopify_signals = {
-        "name",
-        "created at",
-        "lineitem sku",
-        "lineitem quantity",
-        "variant sku",
-        "shipping country",
-        "shipping province",
-        "financial status",
-        "fulfillment status",
-    }
-    score = len(shopify_signals.intersection(cols))
-    return score >= 3
+    # Only the column labels matter here; never touch (or copy) the data.
+    return _detect_shopify_cols({str(c).strip().lower() for c in raw_df.columns})
 
 
 SHOPIFY_COLUMN_MAP = {
@@ -60,6 +64,15 @@ SHOPIFY_COLUMN_MAP = {
 }
 
 
+_REQUIRED_ORDERS: Tuple[str, ...] = (
+    "order_id",
+    "order_datetime_utc",
+    "sku",
+    "quantity_ordered",
+    "customer_country",
+)
+
+
 # -------------------------------
 # Public API
 # -------------------------------
@@ -87,91 +100,46 @@ def normalize_orders(
     df = _lower_cols(_clean_cols(raw_orders))
 
     # Detect Shopify & map columns
-    is_shopify = detect_shopify_orders(raw_orders) or (platform_hint.lower() == "shopify")
+    is_shopify = _detect_shopify_cols(set(df.columns)) or (platform_hint.lower() == "shopify")
 
     if is_shopify:
-        rename_map = {c: SHOPIFY_COLUMN_MAP[c] for c in df.columns if c in SHOPIFY_COLUMN_MAP}
+        rename_map = {c: SHOPIFY_COLUMN_MAP[c] for c in SHOPIFY_COLUMN_MAP.keys() & set(df.columns)}
         df = df.rename(columns=rename_map)
 
-    # Ensure required columns exist
-    required = [
-        ColumnRule("order_id", True),
-        ColumnRule("order_datetime_utc", True),
-        ColumnRule("sku", True),
-        ColumnRule("quantity_ordered", True),
-        ColumnRule("customer_country", True),
-    ]
-    for col in [r.name for r in required]:
-        if col not in df.columns:
-            df[col] = pd.NA
-
-    # Tenant columns
-    df["account_id"] = account_id
-    df["store_id"] = store_id
-    df["platform"] = "shopify" if is_shopify else (platform_hint or "other")
-
-    # Clean fields
-    df["order_id"] = _safe_str(df["order_id"]).str.strip()
-    df["sku"] = _safe_str(df["sku"]).str.strip().str.upper()
-
-    # Datetime
-    df["order_datetime_utc"] = _to_utc(df["order_datetime_utc"])
-
-    # Quantity
-    df["quantity_ordered"] = _to_int(df["quantity_ordered"], default=1)
-    df.loc[df["quantity_ordered"] <= 0, "quantity_ordered"] = 1
-
-    # Country/state
-    df["customer_country"] = _safe_str(df["customer_country"]).str.strip().str.upper()
-    # if someone gives full country names, we keep as-is for MVP; later can ISO-map
-    df["customer_country"] = df["customer_country"].str[:2].where(df["customer_country"].str.len() >= 2, df["customer_country"])
-    df["customer_state"] = _safe_str(df.get("customer_state", pd.Series([], dtype="string"))).str.strip()
-
-    # Optional financial/shipping
-    if "order_revenue" in df.columns:
-        df["order_revenue"] = _to_float(df["order_revenue"])
-    else:
-        df["order_revenue"] = pd.NA
-
-    if "currency" in df.columns:
-        df["currency"] = _safe_str(df["currency"]).str.strip().str.upper()
-    else:
-        df["currency"] = default_currency
-
-    if "shipping_method" in df.columns:
-        df["shipping_method"] = _safe_str(df["shipping_method"]).str.strip()
-    else:
-        df["shipping_method"] = ""
-
-    df["promised_ship_days"] = int(default_promised_ship_days)
-
-    # Validation errors
-    errors.extend(_require_cols(df, required, "orders"))
+    # Validation
+    errors.extend(_require_cols(df, _REQUIRED_ORDERS, "orders"))
 
     # Drop obvious empties
-    df = df[df["order_id"].str.len() > 0].copy()
-    df = df[df["sku"].str.len() > 0].copy()
-
-    out_cols = [
-        "account_id",
-        "store_id",
-        "platform",
-        "order_id",
-        "order_datetime_utc",
-        "sku",
-        "quantity_ordered",
-        "customer_country",
-        "customer_state",
-        "order_revenue",
-        "currency",
-        "shipping_method",
-        "promised_ship_days",
-    ]
-
-    # keep any missing columns safe
-    for c in out_cols:
-        if c not in df.columns:
-            df[c] = pd.NA
-
-    return df[out_cols], _validation(errors)
+    order_id = _safe_str(_col(df, "order_id")).str.strip()
+    sku = _safe_str(_col(df, "sku")).str.strip().str.upper()
+    keep = order_id.ne("") & sku.ne("")
+    if not keep.all():
+        df, order_id, sku = df.loc[keep], order_id.loc[keep], sku.loc[keep]
+
+    # Clean fields
+    cleaned: Dict[str, Any] = {
+        # Tenant columns
+        "account_id": account_id,
+        "store_id": store_id,
+        "platform": "shopify" if is_shopify else (platform_hint or "other"),
+        "order_id": order_id,
+        "order_datetime_utc": _to_utc(_col(df, "order_datetime_utc")),
+        "sku": sku,
+        "quantity_ordered": _to_int(_col(df, "quantity_ordered"), default=1).clip(lower=1),
+        # Country/state
+        # if someone gives full country names, we keep the first 2 chars for MVP; later can ISO-map
+        "customer_country": _norm_enum(_col(df, "customer_country"), width=2),
+        "customer_state": _safe_str(_col(df, "customer_state")).str.strip(),
+        # Optional financial/shipping
+        "order_revenue": _to_float(_col(df, "order_revenue")),
+        "currency": (
+            _norm_enum(_col(df, "currency"))
+            if "currency" in df.columns
+            else pd.Series(default_currency, index=df.index, dtype="category")
+        ),
+        "shipping_method": _safe_str(_col(df, "shipping_method")).str.strip(),
+        "promised_ship_days": int(default_promised_ship_days),
+    }
+    df = pd.DataFrame(cleaned, index=df.index)
 
+    return df, _validation(errors)
@@ -4,7 +4,57 @@ from typing import Any, Dict, List, Tuple
 
 import pandas as pd
 
-from .helpers import ColumnRule, _clean_cols, _lower_cols, _require_cols, _safe_str, _to_int, _to_utc, _validation
+from .helpers import _clean_cols, _col, _lower_cols, _norm_enum, _require_cols, _safe_str, _to_int, _to_utc, _validation
+
+# Basic flexible renames (users will upload messy formats)
+_RENAME_SHIP = {
+    "supplier": "supplier_name",
+    "supplier name": "supplier_name",
+    "vendor": "supplier_name",
+
+    "supplier order id": "supplier_order_id",
+    "supplier_order_id": "supplier_order_id",
+    "po": "supplier_order_id",
+    "purchase order": "supplier_order_id",
+
+    "order id": "order_id",
+    "order_id": "order_id",
+    "shopify order id": "order_id",
+    "name": "order_id",  # sometimes they paste Shopify order name
+
+    "sku": "sku",
+    "item sku": "sku",
+    "lineitem sku": "sku",
+
+    "quantity": "quantity_shipped",
+    "qty": "quantity_shipped",
+    "quantity shipped": "quantity_shipped",
+
+    "ship date": "ship_datetime_utc",
+    "shipped at": "ship_datetime_utc",
+    "ship_datetime_utc": "ship_datetime_utc",
+    "shipment date": "ship_datetime_utc",
+
+    "carrier": "carrier",
+    "tracking": "tracking_number",
+    "tracking number": "tracking_number",
+    "tracking_number": "tracking_number",
+
+    "from country": "ship_from_country",
+    "ship from country": "ship_from_country",
+    "to country": "ship_to_country",
+    "ship to country": "ship_to_country",
+}
+
+
+_REQUIRED_SHIPMENTS: Tuple[str, ...] = (
+    "supplier_name",
+    "supplier_order_id",
+    "sku",
+    "quantity_shipped",
+    "ship_datetime_utc",
+)
+
 
 def normalize_shipments(
     raw_shipments: pd.DataFrame,
@@ -24,104 +74,35 @@ def normalize_shipments(
 
     df = _lower_cols(_clean_cols(raw_shipments))
 
-    # Basic flexible renames (users will upload messy formats)
-    rename_candidates = {
-        "supplier": "supplier_name",
-        "supplier name": "supplier_name",
-        "vendor": "supplier_name",
-
-        "supplier order id": "supplier_order_id",
-        "supplier_order_id": "supplier_order_id",
-        "po": "supplier_order_id",
-        "purchase order": "supplier_order_id",
-
-        "order id": "order_id",
-        "order_id": "order_id",
-        "shopify order id": "order_id",
-        "name": "order_id",  # sometimes they paste Shopify order name
-
-        "sku": "sku",
-        "item sku": "sku",
-        "lineitem sku": "sku",
-
-        "quantity": "quantity_shipped",
-        "qty": "quantity_shipped",
-        "quantity shipped": "quantity_shipped",
-
-        "ship date": "ship_datetime_utc",
-        "shipped at": "ship_datetime_utc",
-        "ship_datetime_utc": "ship_datetime_utc",
-        "shipment date": "ship_datetime_utc",
-
-        "carrier": "carrier",
-        "tracking": "tracking_number",
-        "tracking number": "tracking_number",
-        "tracking_number": "tracking_number",
-
-        "from country": "ship_from_country",
-        "ship from country": "ship_from_country",
-        "to country": "ship_to_country",
-        "ship to country": "ship_to_country",
-    }
-
-    rename_map = {c: rename_candidates[c] for c in df.columns if c in rename_candidates}
+    rename_map = {c: _RENAME_SHIP[c] for c in _RENAME_SHIP.keys() & set(df.columns)}
     df = df.rename(columns=rename_map)
 
-    # Ensure required columns exist
-    required = [
-        ColumnRule("supplier_name", True),
-        ColumnRule("supplier_order_id", True),
-        ColumnRule("sku", True),
-        ColumnRule("quantity_shipped", True),
-        ColumnRule("ship_datetime_utc", True),
-    ]
-    for col in [r.name for r in required]:
-        if col not in df.columns:
-            df[col] = pd.NA
-
-    # Tenant
-    df["account_id"] = account_id
-    df["store_id"] = store_id
-
-    # Clean types
-    df["supplier_name"] = _safe_str(df["supplier_name"]).str.strip().replace("", "Unknown Supplier")
-    df["supplier_order_id"] = _safe_str(df["supplier_order_id"]).str.strip()
-    df["order_id"] = _safe_str(df.get("order_id", pd.Series([], dtype="string"))).str.strip()
-
-    df["sku"] = _safe_str(df["sku"]).str.strip().str.upper()
-    df["quantity_shipped"] = _to_int(df["quantity_shipped"], default=0)
-    df["ship_datetime_utc"] = _to_utc(df["ship_datetime_utc"])
-
-    df["carrier"] = _safe_str(df.get("carrier", pd.Series([], dtype="string"))).str.strip()
-    df["tracking_number"] = _safe_str(df.get("tracking_number", pd.Series([], dtype="string"))).str.strip()
-
-    df["ship_from_country"] = _safe_str(df.get("ship_from_country", pd.Series([], dtype="string"))).str.strip().str.upper().str[:2]
-    df["ship_to_country"] = _safe_str(df.get("ship_to_country", pd.Series([], dtype="string"))).str.strip().str.upper().str[:2]
-
     # Validation
-    errors.extend(_require_cols(df, required, "shipments"))
+    errors.extend(_require_cols(df, _REQUIRED_SHIPMENTS, "shipments"))
 
     # Drop empty criticals
-    df = df[df["supplier_order_id"].str.len() > 0].copy()
-    df = df[df["sku"].str.len() > 0].copy()
-
-    out_cols = [
-        "account_id",
-        "store_id",
-        "supplier_name",
-        "supplier_order_id",
-        "order_id",
-        "sku",
-        "quantity_shipped",
-        "ship_datetime_utc",
-        "carrier",
-        "tracking_number",
-        "ship_from_country",
-        "ship_to_country",
-    ]
-    for c in out_cols:
-        if c not in df.columns:
-            df[c] = pd.NA
-
-    return df[out_cols], _validation(errors)
+    supplier_order_id = _safe_str(_col(df, "supplier_order_id")).str.strip()
+    sku = _safe_str(_col(df, "sku")).str.strip().str.upper()
+    keep = supplier_order_id.ne("") & sku.ne("")
+    if not keep.all():
+        df, supplier_order_id, sku = df.loc[keep], supplier_order_id.loc[keep], sku.loc[keep]
+
+    # Clean types
+    cleaned: Dict[str, Any] = {
+        # Tenant
+        "account_id": account_id,
+        "store_id": store_id,
+        "supplier_name": _safe_str(_col(df, "supplier_name")).str.strip().replace("", "Unknown Supplier"),
+        "supplier_order_id": supplier_order_id,
+        "order_id": _safe_str(_col(df, "order_id")).str.strip(),
+        "sku": sku,
+        "quantity_shipped": _to_int(_col(df, "quantity_shipped"), default=0),
+        "ship_datetime_utc": _to_utc(_col(df, "ship_datetime_utc")),
+        "carrier": _norm_enum(_col(df, "carrier"), upper=False),
+        "tracking_number": _safe_str(_col(df, "tracking_number")).str.strip(),
+        "ship_from_country": _norm_enum(_col(df, "ship_from_country"), width=2),
+        "ship_to_country": _norm_enum(_col(df, "ship_to_country"), width=2),
+    }
+    df = pd.DataFrame(cleaned, index=df.index)
 
+    return df, _validation(errors)
@@ -17,6 +17,7 @@ import pandas as pd
 import streamlit as st
 
 from ui.app_helpers import is_empty_df
+from ui.app_pipeline_cache import NormalizeSettings, normalize_inputs, reconcile_inputs
 
 
 def run_pipeline(
@@ -92,20 +93,22 @@ def run_pipeline(
     st.divider()
     st.subheader("Data checks")
 
-    orders, meta_o = normalize_orders(
+    # Cached on the raw inputs' content: widget-only reruns skip re-normalizing.
+    orders, meta_o, shipments, meta_s, tracking, meta_t = normalize_inputs(
         raw_orders,
-        account_id=account_id,
-        store_id=store_id,
-        platform_hint=platform_hint,
-        default_currency=default_currency,
-        default_promised_ship_days=int(default_promised_ship_days),
+        raw_shipments,
+        raw_tracking,
+        NormalizeSettings(
+            account_id=account_id,
+            store_id=store_id,
+            platform_hint=platform_hint,
+            default_currency=default_currency,
+            default_promised_ship_days=int(default_promised_ship_days),
+        ),
+        normalize_orders=normalize_orders,
+        normalize_shipments=normalize_shipments,
+        normalize_tracking=normalize_tracking,
     )
-    shipments, meta_s = normalize_shipments(raw_shipments, account_id=account_id, store_id=store_id)
-
-    tracking = pd.DataFrame()
-    meta_t = {"validation_errors": []}
-    if raw_tracking is not None and isinstance(raw_tracking, pd.DataFrame) and not raw_tracking.empty:
-        tracking, meta_t = normalize_tracking(raw_tracking, account_id=account_id, store_id=store_id)
 
     errs = meta_o.get("validation_errors", []) + meta_s.get("validation_errors", []) + meta_t.get(
         "validation_errors", []
@@ -124,7 +127,9 @@ def run_pipeline(
     st.subheader("Running reconciliation")
 
     try:
-        line_status_df, exceptions, followups, order_rollup, kpis = reconcile_all(orders, shipments, tracking)
+        line_status_df, exceptions, followups, order_rollup, kpis = reconcile_inputs(
+            orders, shipments, tracking, reconcile_all=reconcile_all
+        )
     except Exception as e:
         st.error("Reconciliation failed. Showing debug details below.")
         st.markdown("### Debug: normalized inputs")
@@ -0,0 +1,172 @@
+"""Cached pipeline stages.
+
+Streamlit reruns the whole script on every widget interaction. The pure
+stages of the pipeline (normalization, reconciliation) only depend on their
+input frames and a few scalars, so they are memoized with `st.cache_data`,
+keyed on a content hash of those frames. New uploads hash differently, so
+invalidation is automatic.
+
+Stages that render widgets or write to the workspace stay uncached in
+`ui.app_pipeline`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+import pandas as pd
+import streamlit as st
+
+
+def frame_fingerprint(df: Optional[pd.DataFrame]) -> Optional[str]:
+    """Content hash of a raw input frame ("" for no frame, None if it can't be hashed)."""
+    if not isinstance(df, pd.DataFrame):
+        return ""
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=False).values
+    except Exception:
+        return None
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr([str(c) for c in df.columns]).encode("utf-8"))
+    h.update(row_hashes.tobytes())
+    return h.hexdigest()
+
+
+class NormalizeSettings(NamedTuple):
+    """Scalar settings for `normalize_orders`; hashed by value in the cache key."""
+
+    account_id: str
+    store_id: str
+    platform_hint: str
+    default_currency: str
+    default_promised_ship_days: int
+
+
+def _normalize_all(
+    raw_orders: pd.DataFrame,
+    raw_shipments: pd.DataFrame,
+    raw_tracking: Optional[pd.DataFrame],
+    settings: NormalizeSettings,
+    *,
+    normalize_orders: Callable[..., Any],
+    normalize_shipments: Callable[..., Any],
+    normalize_tracking: Callable[..., Any],
+) -> Tuple[pd.DataFrame, Dict[str, Any], pd.DataFrame, Dict[str, Any], pd.DataFrame, Dict[str, Any]]:
+    orders, meta_o = normalize_orders(
+        raw_orders,
+        account_id=settings.account_id,
+        store_id=settings.store_id,
+        platform_hint=settings.platform_hint,
+        default_currency=settings.default_currency,
+        default_promised_ship_days=settings.default_promised_ship_days,
+    )
+    shipments, meta_s = normalize_shipments(raw_shipments, account_id=settings.account_id, store_id=settings.store_id)
+
+    tracking = pd.DataFrame()
+    meta_t = {"validation_errors": []}
+    if raw_tracking is not None and isinstance(raw_tracking, pd.DataFrame) and not raw_tracking.empty:
+        tracking, meta_t = normalize_tracking(raw_tracking, account_id=settings.account_id, store_id=settings.store_id)
+
+    return orders, meta_o, shipments, meta_s, tracking, meta_t
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _normalize_cached(
+    orders_key: str,
+    shipments_key: str,
+    tracking_key: str,
+    settings: NormalizeSettings,
+    # Underscore-prefixed args are not hashed by Streamlit; the *_key args stand in for them.
+    _raw_orders: pd.DataFrame,
+    _raw_shipments: pd.DataFrame,
+    _raw_tracking: Optional[pd.DataFrame],
+    _normalize_orders: Callable[..., Any],
+    _normalize_shipments: Callable[..., Any],
+    _normalize_tracking: Callable[..., Any],
+):
+    return _normalize_all(
+        _raw_orders,
+        _raw_shipments,
+        _raw_tracking,
+        settings,
+        normalize_orders=_normalize_orders,
+        normalize_shipments=_normalize_shipments,
+        normalize_tracking=_normalize_tracking,
+    )
+
+
+def normalize_inputs(
+    raw_orders: pd.DataFrame,
+    raw_shipments: pd.DataFrame,
+    raw_tracking: Optional[pd.DataFrame],
+    settings: NormalizeSettings,
+    *,
+    normalize_orders: Callable[..., Any],
+    normalize_shipments: Callable[..., Any],
+    normalize_tracking: Callable[..., Any],
+) -> Tuple[pd.DataFrame, Dict[str, Any], pd.DataFrame, Dict[str, Any], pd.DataFrame, Dict[str, Any]]:
+    """
+    Normalize orders / shipments / tracking, reusing the previous result when
+    the raw inputs and settings are unchanged.
+
+    Returns: (orders, meta_orders, shipments, meta_shipments, tracking, meta_tracking)
+    """
+    keys = [frame_fingerprint(df) for df in (raw_orders, raw_shipments, raw_tracking)]
+    if any(k is None for k in keys):
+        # Unhashable cell values: skip the cache rather than fail.
+        return _normalize_all(
+            raw_orders,
+            raw_shipments,
+            raw_tracking,
+            settings,
+            normalize_orders=normalize_orders,
+            normalize_shipments=normalize_shipments,
+            normalize_tracking=normalize_tracking,
+        )
+
+    return _normalize_cached(
+        *keys,
+        settings,
+        raw_orders,
+        raw_shipments,
+        raw_tracking,
+        normalize_orders,
+        normalize_shipments,
+        normalize_tracking,
+    )
+
+
+# Reconciliation ages lines against "now", so results expire after a few minutes.
+@st.cache_data(show_spinner=False, max_entries=8, ttl=300)
+def _reconcile_cached(
+    orders_key: str,
+    shipments_key: str,
+    tracking_key: str,
+    _orders: pd.DataFrame,
+    _shipments: pd.DataFrame,
+    _tracking: pd.DataFrame,
+    _reconcile_all: Callable[..., Any],
+):
+    return _reconcile_all(_orders, _shipments, _tracking)
+
+
+def reconcile_inputs(
+    orders: pd.DataFrame,
+    shipments: pd.DataFrame,
+    tracking: pd.DataFrame,
+    *,
+    reconcile_all: Callable[..., Any],
+):
+    """
+    Run `reconcile_all` on the normalized frames, reusing a recent result when
+    they are unchanged.
+
+    Returns: (line_status_df, exceptions, followups, order_rollup, kpis)
+    """
+    keys = [frame_fingerprint(df) for df in (orders, shipments, tracking)]
+    if any(k is None for k in keys):
+        return reconcile_all(orders, shipments, tracking)
+
+    return _reconcile_cached(*keys, orders, shipments, tracking, reconcile_all)
@@ -6,6 +6,7 @@ Split out of app.py to keep files <500 lines while preserving behavior.
 from __future__ import annotations
 
 import inspect
+import io
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional, Tuple
 
@@ -33,6 +34,19 @@ def is_empty_df(x) -> bool:
     return (x is None) or (not isinstance(x, pd.DataFrame)) or x.empty
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def _read_csv_bytes(data: bytes) -> pd.DataFrame:
+    return pd.read_csv(io.BytesIO(data))
+
+
+def _read_csv_upload(f: Any) -> pd.DataFrame:
+    """Parse an uploaded CSV once per file content (reruns reuse the parsed frame)."""
+    getvalue = getattr(f, "getvalue", None)
+    if callable(getvalue):
+        return _read_csv_bytes(getvalue())
+    return pd.read_csv(f)
+
+
 # -----------------------------
 # Sections: Start + Upload
 # -----------------------------
@@ -124,9 +138,9 @@ def resolve_raw_inputs(
         raw_tracking = st.session_state.get("demo_raw_tracking", pd.DataFrame())
         return raw_orders, raw_shipments, raw_tracking
 
-    raw_orders = pd.read_csv(uploads.f_orders)
-    raw_shipments = pd.read_csv(uploads.f_shipments)
-    raw_tracking = pd.read_csv(uploads.f_tracking) if uploads.f_tracking else pd.DataFrame()
+    raw_orders = _read_csv_upload(uploads.f_orders)
+    raw_shipments = _read_csv_upload(uploads.f_shipments)
+    raw_tracking = _read_csv_upload(uploads.f_tracking) if uploads.f_tracking else pd.DataFrame()
     return raw_orders, raw_shipments, raw_tracking
 
 
@@ -12,7 +12,7 @@ import streamlit as st
 from ui.app_shell_utils import _call_with_accepted_kwargs, _require_import
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _ShellDeps:
     # sidebar + onboarding
     render_sidebar_context: Callable[..., dict]
@@ -70,6 +70,8 @@ class _ShellDeps:
 _UNEXPECTED_KW_RE = re.compile(r"unexpected keyword argument '([^']+)'")
 
 
+# Resolved once per server process; reruns reuse the same (frozen) deps object.
+@st.cache_resource(show_spinner=False)
 def _safe_imports() -> _ShellDeps:
     # Sidebar + onboarding
     from ui.sidebar import render_sidebar_context
@@ -0,0 +1,268 @@
+# ui/app_shell_sections.py
+"""Scroll-first sections rendered by `render_app`.
+
+Sections that just call a deps renderer are described by `_Section` specs and
+rendered by one helper; the outreach and follow-up tracker sections have their
+own renderers. `render_sections` lays them out in display order.
+
+Each section is a Streamlit fragment: a widget interaction inside one section
+reruns only that section, not the whole script (and therefore not the
+pipeline). Actions that change shared state call `st.rerun()`, which still
+reruns the app.
+
+Constraint: keep files small (<300 lines).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import pandas as pd
+import streamlit as st
+
+from ui.app_shell_utils import _call_with_accepted_kwargs, _get_df
+
+
+def _no_fragment(fn):
+    return fn
+
+
+# `st.fragment` (Streamlit >= 1.37), `st.experimental_fragment` (1.33-1.36).
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or _no_fragment
+
+
+class _Section(NamedTuple):
+    title: str
+    label: str  # used in "<label> failed to render" / "<label> not available"
+    fn_name: str  # renderer attribute on deps
+    # (view, ctx) -> renderer kwargs; ctx holds render_app's shared values
+    build_kwargs: Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]
+    # Rendered instead when deps has no callable `fn_name`
+    fallback: Optional[Callable[[Any, Dict[str, Any], Dict[str, Any]], None]] = None
+
+
+def _fallback_issue_tracker_renderer():
+    """
+    Try to import the follow-up tracker UI directly.
+    Supports multiple historical export names.
+    Returns callable or None.
+    """
+    try:
+        from ui.issue_tracker_ui import render_issue_tracker_ui as fn  # type: ignore
+        return fn
+    except Exception:
+        pass
+
+    try:
+        from ui.issue_tracker_ui import render_issue_tracker as fn  # type: ignore
+        return fn
+    except Exception:
+        return None
+
+
+# Nested fragments need `st.fragment` (>= 1.37); older versions render tabs inline.
+_tab_fragment = getattr(st, "fragment", None) or _no_fragment
+
+
+@_tab_fragment
+def _render_outreach_tab(deps: Any, view: Dict[str, Any], ctx: Dict[str, Any], label: str) -> None:
+    try:
+        _call_with_accepted_kwargs(
+            deps.render_ops_outreach_comms,
+            followups_open=_get_df(view, "followups_open"),
+            customer_impact=_get_df(view, "customer_impact"),
+            mailto_link=view.get("mailto_link", ""),
+            scorecard=ctx["scorecard_df"],
+            ws_root=ctx["ws_root"],
+            issue_tracker_path=ctx["issue_tracker_path"],
+            contact_statuses=ctx["contact_statuses"],
+            recipient=label,          # optional (ignored if not accepted)
+            audience=label,           # optional (ignored if not accepted)
+            person_type=label,        # optional (ignored if not accepted)
+            view=view,
+        )
+    except Exception as e:
+        st.warning("Ops outreach failed to render (non-critical).")
+        st.code(str(e))
+
+
+@_fragment
+def _render_outreach_section(deps: Any, view: Dict[str, Any], ctx: Dict[str, Any]) -> None:
+    st.header("Action Center — Emails")
+    st.caption("Auto-generated drafts by recipient. Copy, send, and track follow-ups.")
+    comm_tabs = st.tabs(["Supplier", "Shipper / Carrier", "Customer"])
+    for label, tab in zip(
+        ["supplier", "shipper", "customer"],
+        comm_tabs,
+    ):
+        with tab:
+            # Each recipient tab is its own fragment: editing a supplier draft
+            # doesn't re-render the shipper / customer drafts.
+            _render_outreach_tab(deps, view, ctx, label)
+
+
+_ESCALATIONS_PAGE_SIZE = 200
+
+
+def _render_escalations_table(deps: Any, view: Dict[str, Any], ctx: Dict[str, Any]) -> None:
+    df = _get_df(view, "escalations_df")
+    if isinstance(df, pd.DataFrame) and not df.empty:
+        # Only one page is serialized to the browser; paging reruns just this fragment.
+        pages = -(-len(df) // _ESCALATIONS_PAGE_SIZE)
+        page = 1
+        if pages > 1:
+            page = int(
+                st.number_input(
+                    f"Page (of {pages}, {len(df)} rows)",
+                    min_value=1,
+                    max_value=pages,
+                    value=1,
+                    step=1,
+                    key="sla_escalations_page",
+                )
+            )
+        start = (page - 1) * _ESCALATIONS_PAGE_SIZE
+        st.dataframe(df.iloc[start : start + _ESCALATIONS_PAGE_SIZE], use_container_width=True)
+    else:
+        st.caption("SLA escalations UI not available.")
+
+
+@_fragment
+def _render_tracker_section(deps: Any, view: Dict[str, Any], ctx: Dict[str, Any]) -> None:
+    # Self-healing: falls back to importing the tracker UI directly.
+    st.header("Follow-up Tracker")
+    try:
+        fn = getattr(deps, "render_issue_tracker_ui", None)
+        if not callable(fn):
+            fn = _fallback_issue_tracker_renderer()
+
+        issue_tracker_path = ctx["issue_tracker_path"]
+        if callable(fn) and issue_tracker_path is not None:
+            _call_with_accepted_kwargs(
+                fn,
+                issue_tracker_path=issue_tracker_path,
+                view=view,
+            )
+        else:
+            st.caption("Follow-up tracker UI not available.")
+            st.caption(f"Debug: issue_tracker_path = `{issue_tracker_path}`")
+            st.caption(
+                f"Debug: deps renderer callable = `{callable(getattr(deps,'render_issue_tracker_ui',None))}`"
+            )
+    except Exception as e:
+        st.warning("Follow-up tracker failed to render (non-critical).")
+        st.code(str(e))
+
+
+def _scorecards_kwargs(view: Dict[str, Any], ctx: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        from core.scorecards import load_recent_scorecard_history  # type: ignore
+    except Exception:
+        load_recent_scorecard_history = None  # type: ignore
+
+    return dict(
+        supplier_scorecards=_get_df(view, "supplier_scorecards"),
+        scorecard=ctx["scorecard_df"],
+        ws_root=ctx["ws_root"],
+        load_recent_scorecard_history=load_recent_scorecard_history,
+        view=view,
+    )
+
+
+_DASHBOARD = _Section(
+    "Dashboard",
+    "Dashboard",
+    "render_dashboard",
+    lambda v, c: dict(
+        kpis=v.get("kpis", {}),
+        run_history_df=_get_df(v, "run_history_df"),
+        exceptions=_get_df(v, "exceptions"),
+        followups_open=_get_df(v, "followups_open"),
+        workspaces_dir=c["workspaces_dir"],
+        account_id=c["account_id"],
+        store_id=c["store_id"],
+        view=v,
+    ),
+)
+
+_OPS_TRIAGE = _Section(
+    "Ops Triage",
+    "Ops triage",
+    "render_ops_triage",
+    lambda v, c: dict(
+        exceptions=_get_df(v, "exceptions"),
+        followups_open=_get_df(v, "followups_open"),
+        ops_pack_bytes=v.get("ops_pack_bytes", b""),
+        pack_name=v.get("pack_name", "daily_ops_pack.zip"),
+        view=v,
+    ),
+)
+
+_EXCEPTIONS_QUEUE = _Section(
+    "Exceptions Queue",
+    "Exceptions queue",
+    "render_exceptions_queue_section",
+    lambda v, c: dict(exceptions=_get_df(v, "exceptions"), view=v),
+)
+
+_SLA_ESCALATIONS = _Section(
+    "SLA Escalations",
+    "SLA escalations",
+    "render_sla_escalations_panel",
+    lambda v, c: dict(escalations_df=_get_df(v, "escalations_df"), view=v),
+    _render_escalations_table,
+)
+
+_SUPPLIER_SCORECARDS = _Section(
+    "Supplier Scorecards",
+    "Supplier scorecards",
+    "render_supplier_scorecards",
+    _scorecards_kwargs,
+)
+
+_KPI_TRENDS = _Section(
+    "KPI Trends",
+    "KPI trends UI",
+    "render_kpi_trends",
+    lambda v, c: dict(
+        workspaces_dir=c["workspaces_dir"],
+        account_id=c["account_id"],
+        store_id=c["store_id"],
+        view=v,
+    ),
+)
+
+
+@_fragment
+def _render_section(deps: Any, section: _Section, view: Dict[str, Any], ctx: Dict[str, Any]) -> None:
+    st.header(section.title)
+    try:
+        fn = getattr(deps, section.fn_name, None)
+        if callable(fn):
+            _call_with_accepted_kwargs(fn, **section.build_kwargs(view, ctx))
+        elif section.fallback is not None:
+            section.fallback(deps, view, ctx)
+        else:
+            st.caption(f"{section.label} not available.")
+    except Exception as e:
+        st.warning(f"{section.label} failed to render (non-critical).")
+        st.code(str(e))
+
+
+def render_sections(deps: Any, view: Dict[str, Any], ctx: Dict[str, Any]) -> None:
+    """Render every section in display order, separated by dividers."""
+    _render_section(deps, _DASHBOARD, view, ctx)
+    st.divider()
+    _render_section(deps, _OPS_TRIAGE, view, ctx)
+    st.divider()
+    _render_section(deps, _EXCEPTIONS_QUEUE, view, ctx)
+    st.divider()
+    _render_outreach_section(deps, view, ctx)
+    st.divider()
+    _render_section(deps, _SLA_ESCALATIONS, view, ctx)
+    st.divider()
+    _render_tracker_section(deps, view, ctx)
+    st.divider()
+    _render_section(deps, _SUPPLIER_SCORECARDS, view, ctx)
+    st.divider()
+    _render_section(deps, _KPI_TRENDS, view, ctx)
@@ -1,15 +1,41 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import re
 from typing import Any, Callable, Optional
 
+import pandas as pd
 import streamlit as st
 
 # Matches: TypeError: foo() got an unexpected keyword argument 'bar'
 _UNEXPECTED_KW_RE = re.compile(r"unexpected keyword argument ['\"]([^'\"]+)['\"]")
 
 
+@functools.lru_cache(maxsize=512)
+def _accepted_params(fn: Callable[..., Any]) -> Optional[frozenset[str]]:
+    """
+    Parameter names `fn` accepts, or None if it takes **kwargs (pass everything).
+
+    Cached: the same render_* callables are introspected on every rerun.
+    """
+    params = inspect.signature(fn).parameters
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+        return None
+    return frozenset(params)
+
+
+def _get_df(mapping: Any, key: str) -> Any:
+    """
+    mapping[key], or an empty DataFrame when missing/None.
+
+    The empty frame is only built on a miss (unlike `.get(key, pd.DataFrame())`),
+    and is never shared: renderers may add columns to what they receive.
+    """
+    v = mapping.get(key)
+    return pd.DataFrame() if v is None else v
+
+
 def _call_with_accepted_kwargs(fn: Callable[..., Any], **kwargs):
     """
     Backward-compat call helper:
@@ -23,8 +49,9 @@ def _call_with_accepted_kwargs(fn: Callable[..., Any], **kwargs):
     """
     filtered = dict(kwargs)
     try:
-        sig = inspect.signature(fn)
-        filtered = {k: v for k, v in kwargs.items() if k in sig.parameters}
+        names = _accepted_params(fn)
+        if names is not None:
+            filtered = {k: v for k, v in kwargs.items() if k in names}
         return fn(**filtered)
     except TypeError as e:
         msg = str(e)
@@ -10,28 +10,86 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Any, Optional
-import inspect
 import hashlib
 
 import pandas as pd
 import streamlit as st
 
-from ui.issue_tracker_ownership_ui import render_issue_ownership_panel
-from ui.issue_tracker_panel_ui import render_issue_tracker_panel
+from ui.app_shell_utils import _accepted_params
 
 
 def _call_with_accepted_kwargs(fn, *args, **kwargs):
     """Call helper that drops unexpected kwargs (keeps backward compat)."""
-    sig = inspect.signature(fn)
-    accepted = {k: v for k, v in kwargs.items() if k in sig.parameters}
+    names = _accepted_params(fn)
+    accepted = kwargs if names is None else {k: v for k, v in kwargs.items() if k in names}
     return fn(*args, **accepted)
 
 
+# Columns that identify a follow-up, in key order (across pipeline versions).
+_ID_CANDIDATE_COLS = (
+    "order_id",
+    "order_name",
+    "line_id",
+    "sku",
+    "supplier_name",
+    "supplier",
+    "exception_type",
+    "exception_reason",
+    "reason",
+    "category",
+    "status",
+)
+
+
+# Columns each panel reads (editor tables + saved context); keep in sync with
+# ui/issue_tracker_panel_ui.py and ui/issue_tracker_ownership_ui.py.
+_TRACKER_PANEL_COLS = (
+    "issue_id",
+    "supplier_name",
+    "supplier_email",
+    "order_id",
+    "order_ids",
+    "item_count",
+    "worst_escalation",
+    "urgency",
+)
+_OWNERSHIP_PANEL_COLS = (
+    "issue_id",
+    "supplier_name",
+    "supplier_email",
+    "order_id",
+    "order_ids",
+    "worst_escalation",
+    "urgency",
+    "owner",
+    "issue_status",
+    "next_action_at",
+    "contact_status",
+    "follow_up_count",
+)
+
+
+def _project(df: pd.DataFrame, cols: tuple[str, ...]) -> pd.DataFrame:
+    present = set(df.columns)
+    return df[[c for c in cols if c in present]]
+
+
+def _hash_key(s: str) -> str:
+    return hashlib.sha1(s.encode("utf-8")).hexdigest()[:12]
+
+
 def _stable_hash_id(parts: list[str]) -> str:
     s = "|".join([p.strip() for p in parts if str(p).strip()])
     if not s:
         s = "unknown"
-    return hashlib.sha1(s.encode("utf-8")).hexdigest()[:12]
+    return _hash_key(s)
+
+
+def _id_part(col: pd.Series) -> pd.Series:
+    """Column values as stripped strings ("" for missing), matching `str(v).strip()`."""
+    if pd.api.types.is_datetime64_any_dtype(col):
+        col = col.astype(object)  # str(Timestamp) keeps the time part
+    return col.astype("string").fillna("").str.strip()
 
 
 def _ensure_issue_id_column(followups: pd.DataFrame) -> pd.DataFrame:
@@ -43,45 +101,41 @@ def _ensure_issue_id_column(followups: pd.DataFrame) -> pd.DataFrame:
     """
     if not isinstance(followups, pd.DataFrame) or followups.empty:
         if isinstance(followups, pd.DataFrame) and "issue_id" not in followups.columns:
-            followups = followups.copy()
+            followups = followups.copy(deep=False)
             followups["issue_id"] = pd.Series(dtype="string")
         return followups
 
     if "issue_id" in followups.columns:
         # ensure string-ish
-        out = followups.copy()
+        if isinstance(followups["issue_id"].dtype, pd.StringDtype):
+            return followups
+        out = followups.copy(deep=False)
         out["issue_id"] = out["issue_id"].astype("string")
         return out
 
-    out = followups.copy()
+    # Shallow copy: only issue_id (and maybe status) are added, the rest is shared.
+    out = followups.copy(deep=False)
 
     # Try to build a good key from common columns across your pipeline versions
-    candidate_cols = [
-        "order_id",
-        "order_name",
-        "line_id",
-        "sku",
-        "supplier_name",
-        "supplier",
-        "exception_type",
-        "exception_reason",
-        "reason",
-        "category",
-        "status",
-    ]
-    cols = [c for c in candidate_cols if c in out.columns]
-
-    def make_id(row) -> str:
-        parts = []
-        for c in cols:
-            v = row.get(c, "")
-            parts.append("" if pd.isna(v) else str(v))
-        # If we found nothing useful, fall back to the row index
-        if not any(p.strip() for p in parts):
-            parts = [str(row.name)]
-        return _stable_hash_id(parts)
-
-    out["issue_id"] = out.apply(make_id, axis=1).astype("string")
+    present = set(out.columns)
+    cols = [c for c in _ID_CANDIDATE_COLS if c in present]
+
+    # Same ids as `_stable_hash_id` over each row's non-blank parts, built
+    # column-wise and hashed once per distinct key.
+    key = pd.Series("", index=out.index, dtype="string")
+    for c in cols:
+        part = _id_part(out[c])
+        key = key + ("|" + part).where(part.ne(""), "")
+    key = key.str[1:]
+
+    # If we found nothing useful, fall back to the row index
+    empty = key.eq("")
+    if empty.any():
+        row_names = pd.Series(out.index.map(str), index=out.index, dtype="string").str.strip()
+        key = key.mask(empty, row_names).mask(lambda k: k.eq(""), "unknown")
+
+    lookup = {k: _hash_key(k) for k in key.unique()}
+    out["issue_id"] = key.map(lookup).astype("string")
 
     # Optional: if panels rely on a "status" column, keep a sane default
     if "status" not in out.columns:
@@ -106,9 +160,13 @@ def render_issue_tracker_ui(
         st.caption("Issue tracker file not available.")
         return
 
+    # Panels are imported on first use, not when the facade is imported.
+    from ui.issue_tracker_ownership_ui import render_issue_ownership_panel
+    from ui.issue_tracker_panel_ui import render_issue_tracker_panel
+
     view = view or {}
 
-    followups_full = view.get("followups_full", pd.DataFrame())
+    followups_full = view.get("followups_full")
     if not isinstance(followups_full, pd.DataFrame):
         followups_full = pd.DataFrame()
 
@@ -116,26 +174,34 @@ def render_issue_tracker_ui(
     followups_full = _ensure_issue_id_column(followups_full)
 
     # If still missing (shouldn’t happen), show a helpful message but continue safely
-    if isinstance(followups_full, pd.DataFrame) and not followups_full.empty and "issue_id" not in followups_full.columns:
+    if not followups_full.empty and "issue_id" not in followups_full.columns:
         st.warning("Issue Tracker requires `issue_id` in followups_full.")
         st.caption("Could not generate issue_id from available columns.")
         st.dataframe(followups_full.head(10), use_container_width=True)
         return
 
     # ----- Main panel -----
+    # Panels copy and serialize what they receive, so pass only the columns they use.
     _call_with_accepted_kwargs(
         render_issue_tracker_panel,
-        followups_full,  # positional required
+        _project(followups_full, _TRACKER_PANEL_COLS),  # positional required
         issue_tracker_path=issue_tracker_path,
         key_prefix=f"{key_prefix}_panel",
     )
 
-    st.divider()
+    # With no follow-ups both panels are just a heading + caption; skip the rule.
+    if not followups_full.empty:
+        st.divider()
 
     # ----- Ownership panel -----
+    # Issue-level (one editable row per issue): keep the first line per issue_id.
+    followups_by_issue = followups_full
+    if "issue_id" in followups_full.columns and followups_full["issue_id"].duplicated().any():
+        followups_by_issue = followups_full.drop_duplicates(subset="issue_id", keep="first")
+
     _call_with_accepted_kwargs(
         render_issue_ownership_panel,
-        followups_full,  # positional followups_df (required by your current signature)
+        _project(followups_by_issue, _OWNERSHIP_PANEL_COLS),  # positional followups_df (required by your current signature)
         issue_tracker_path=issue_tracker_path,
         key_prefix=f"{key_prefix}_own",
     )
@@ -6,6 +6,13 @@ Canonical implementation lives in ui/workspaces_ui.py.
 
 from __future__ import annotations
 
-from ui.workspaces_ui import WorkspacesResult, render_workspaces_sidebar
-
 __all__ = ["render_workspaces_sidebar", "WorkspacesResult"]
+
+
+def __getattr__(name: str):
+    # Resolve re-exports on first access so importing this shim stays cheap.
+    if name in __all__:
+        from ui import workspaces_ui
+
+        return getattr(workspaces_ui, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")